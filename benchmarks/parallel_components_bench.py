@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Measure how parallel_components.connected_components scales with the
+number of processes, on a random graph.
+
+The first row is the serial path (a plain UnionFindArray, what
+connected_components runs for a single process); the rest run the
+lock-free algorithm over a pool of 1, 2, 4, ... worker processes, and
+their speedup is relative to the pool of 1, so it measures parallelism
+alone, not the change of algorithm.
+
+Usage:
+  python3 benchmarks/parallel_components_bench.py [num_items [num_edges]]
+
+Run it from the repository's root directory.
+"""
+
+
+import array
+import os
+import random
+import sys
+import time
+# modules I've written:
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import parallel_components
+
+
+def random_edges(num_items, num_edges):
+    """Return an array.array('q') with the endpoints of random edges."""
+    return array.array('q', (random.randrange(num_items)
+                             for _ in range(2 * num_edges)))
+
+
+def main():
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    num_edges = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * 10**6
+    edges = random_edges(num_items, num_edges)
+    max_processes = os.cpu_count() or 1
+    print('{} items, {} edges, {} cpus'.format(num_items, num_edges,
+                                               max_processes))
+    print('{:>9} {:>10} {:>8}'.format('processes', 'seconds', 'speedup'))
+    start = time.perf_counter()
+    num_clusters, _ = parallel_components.connected_components(
+        num_items, edges, processes=1)
+    print('{:>9} {:>10.2f} {:>8}'.format('serial',
+                                         time.perf_counter() - start, '-'))
+    processes = 1
+    baseline = None
+    while processes <= max_processes:
+        start = time.perf_counter()
+        num_clusters, _ = parallel_components._parallel_components(
+            num_items, edges, num_edges, processes, processes)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        print('{:>9} {:>10.2f} {:>8.2f}'.format(processes, elapsed,
+                                                baseline / elapsed))
+        if processes < max_processes:
+            processes = min(2 * processes, max_processes)
+        else:
+            break
+    print('{} clusters'.format(num_clusters))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compare timing_wheel.TimingWheel with binary_heap.BinaryHeap on a timer
+workload: insert a number of timers, cancel most of them, then pop the rest
+in order.
+
+BinaryHeap has no cancel, so timers are cancelled lazily for it (the usual
+trick): cancelled timers are remembered in a set and skipped when popped.
+
+Usage:
+  python3 benchmarks/timing_wheel_bench.py [num_timers [cancel_ratio]]
+
+Run it from the repository's root directory.
+"""
+
+
+import os
+import random
+import sys
+import time
+# modules I've written:
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import binary_heap
+import timing_wheel
+
+
+def bench_heap(deadlines, cancelled):
+    """Run the workload on a BinaryHeap; return the elapsed seconds."""
+    start = time.perf_counter()
+    heap = binary_heap.BinaryHeap()
+    for timer, deadline in enumerate(deadlines):
+        heap.insert((deadline, timer))
+    cancelled_timers = set()
+    for timer in cancelled:
+        cancelled_timers.add(timer)
+    while len(heap) > 0:
+        deadline, timer = heap.pop()
+        if timer in cancelled_timers:
+            cancelled_timers.discard(timer)
+    return time.perf_counter() - start
+
+
+def bench_wheel(deadlines, cancelled):
+    """Run the workload on a TimingWheel; return the elapsed seconds."""
+    start = time.perf_counter()
+    wheel = timing_wheel.TimingWheel()
+    handles = []
+    for timer, deadline in enumerate(deadlines):
+        handles.append(wheel.insert((deadline, timer)))
+    for timer in cancelled:
+        wheel.cancel(handles[timer])
+    while len(wheel) > 0:
+        wheel.pop()
+    return time.perf_counter() - start
+
+
+def main():
+    num_timers = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    cancel_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.9
+    # deadlines within about a minute, in milliseconds
+    deadlines = [random.randrange(60000) for _ in range(num_timers)]
+    cancelled = random.sample(range(num_timers),
+                              int(cancel_ratio * num_timers))
+    print('{} timers, {:.0%} cancelled'.format(num_timers, cancel_ratio))
+    heap_seconds = bench_heap(deadlines, cancelled)
+    print('{:<12} {:>8.2f} s'.format('BinaryHeap', heap_seconds))
+    wheel_seconds = bench_wheel(deadlines, cancelled)
+    print('{:<12} {:>8.2f} s'.format('TimingWheel', wheel_seconds))
+    print('speedup: {:.2f}'.format(heap_seconds / wheel_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Operations:
 - insert 
 - pop
 - peek
+- save / load
 
 Author:  
   Christos Nitsas  
@@ -20,12 +21,25 @@ Date:
 """
 
 
+import array
 import operator
+import pickle
+import struct
+import sys
 
 
 __all__ = ['BinaryHeap', 'heapify']
 
 
+# header of a saved heap:
+# magic, kind, array typecode, max_, little endian, number of items
+_header = struct.Struct('<4scc??Q')
+_magic = b'BHP1'
+# kinds of saved heaps
+_ARRAY = b'a'
+_PICKLE = b'p'
+
+
 def heapify(list_, max_=False):
     """
     Turn a list into a binary heap in place, in linear time.
@@ -61,6 +75,22 @@ def _swap(list_, a, b):
     list_[a], list_[b] = list_[b], list_[a]
 
 
+def _array_typecode(items):
+    """
+    Return the array.array typecode that can hold all the items, or None if
+    they're not all ints fitting in 8 bytes or not all floats.
+    
+    items -- a list
+    """
+    if all(type(item) is int for item in items):
+        if len(items) > 0 and (min(items) < -2**63 or max(items) >= 2**63):
+            return None
+        return 'q'
+    if all(type(item) is float for item in items):
+        return 'd'
+    return None
+
+
 def _shift_up(list_, index, less):
     """
     Move a heap node up in the heap, as long as needed.
@@ -210,3 +240,60 @@ class BinaryHeap:
         _shift_down(self._items, 0, self._less)
         # return
         return min_item
+    
+    def save(self, file):
+        """
+        Save the heap to a binary file.
+        
+        file -- a file object open for writing in binary mode
+        
+        Heaps of ints (that fit in 8 bytes) or floats are written as a raw
+        array of numbers; any other heap is pickled. Either way, the items are
+        saved in heap order, so load() doesn't have to restore the heap
+        property. Several heaps can be saved one after the other in the same
+        file.
+        """
+        typecode = _array_typecode(self._items)
+        kind = _PICKLE if typecode is None else _ARRAY
+        max_ = self._less is operator.gt
+        file.write(_header.pack(_magic, kind, (typecode or 'x').encode(),
+                                max_, sys.byteorder == 'little',
+                                len(self._items)))
+        if kind == _ARRAY:
+            array.array(typecode, self._items).tofile(file)
+        else:
+            pickle.dump(self._items, file, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, file):
+        """
+        Load a heap saved with save() from a binary file.
+        
+        file -- a file object open for reading in binary mode
+        
+        Loading is a single sequential read; the items are not sifted again.
+        The loaded heap is always backed by a list, so it accepts any item
+        the saved heap would have accepted.
+        
+        Raises a `ValueError` if the file doesn't hold a saved heap at the
+        current position, and an `EOFError` if the heap is cut short.
+        """
+        header = file.read(_header.size)
+        if len(header) != _header.size:
+            raise ValueError('not a saved heap')
+        magic, kind, typecode, max_, little_endian, num_items = \
+            _header.unpack(header)
+        if magic != _magic or kind not in (_ARRAY, _PICKLE):
+            raise ValueError('not a saved heap')
+        heap = cls(max_=max_)
+        if kind == _ARRAY:
+            items = array.array(typecode.decode())
+            items.fromfile(file, num_items)
+            if little_endian != (sys.byteorder == 'little'):
+                items.byteswap()
+            items = items.tolist()
+        else:
+            items = pickle.load(file)
+        # the items are already in heap order
+        heap._items = items
+        return heap
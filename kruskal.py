@@ -0,0 +1,163 @@
+"""
+Kruskal's minimum spanning tree and single-linkage clustering on a stream
+of edges.
+
+Operations:
+- kruskal
+- cluster_labels
+
+Edges are consumed in chunks. Each chunk is merged with the spanning forest
+found so far (the cycle property guarantees that no edge outside that forest
+can ever enter the final minimum spanning forest), so we never fully sort the
+edges; each round heapifies its candidate edges in linear time and only pops
+as many as it needs. Chunks hold at least `len(items)` edges, so the O(n)
+cost of each round is paid for by the edges it consumes.
+
+Author:
+  Christos Nitsas
+  (nitsas)
+  (chrisnitsas)
+
+Language:
+  Python 3(.4)
+
+Date:
+  October, 2026
+"""
+
+
+import itertools
+# modules I've implemented
+import binary_heap
+import unionfind
+
+
+__all__ = ['kruskal', 'cluster_labels']
+
+
+def _chunks(edges, chunk_size):
+    """
+    Yield lists of at most chunk_size edges from an iterable of edges.
+    
+    edges -- an iterable of edges
+    chunk_size -- the number of edges per chunk; None for a single chunk
+    """
+    if chunk_size is None:
+        yield list(edges)
+        return
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    edges = iter(edges)
+    while True:
+        chunk = list(itertools.islice(edges, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _spanning_forest(items, candidates, max_edges):
+    """
+    Return the minimum spanning forest of the candidate edges as a list of
+    edges sorted by cost.
+    
+    items -- an iterable of all the items (nodes)
+    candidates -- an iterable of (cost, item_a, item_b) edges
+    max_edges -- stop as soon as the forest has this many edges
+    """
+    clusters = unionfind.UnionFindStructure(items)
+    # the sequence number breaks ties between edges of equal cost, so that
+    # items never get compared (they only need to be hashable)
+    heap = binary_heap.BinaryHeap([(edge[0], seq, edge)
+                                   for seq, edge in enumerate(candidates)])
+    forest = []
+    while len(heap) > 0 and len(forest) < max_edges:
+        _, _, edge = heap.pop()
+        item_a, item_b = edge[1], edge[2]
+        if not clusters.joined(item_a, item_b):
+            clusters.union(item_a, item_b)
+            forest.append(edge)
+    return forest
+
+
+def kruskal(items, edges, num_clusters=1, chunk_size=None):
+    """
+    Run Kruskal's algorithm on a stream of edges.
+    
+    items -- an iterable of all the items (nodes)
+    edges -- an iterable of (cost, item_a, item_b) edges, in any order; use
+             itertools.chain.from_iterable() to pass edges that arrive in
+             blocks (e.g. read from disk one block at a time)
+    num_clusters -- the number of clusters we want to end up with; 1 (the
+                    default) gives a minimum spanning tree (or forest, if
+                    the graph is not connected)
+    chunk_size -- the number of edges to consume at a time; None (the
+                  default) consumes all edges at once; values below
+                  len(items) are raised to len(items), since every chunk
+                  costs O(len(items)) time anyway
+    
+    Returns a tuple (tree_edges, clusters) where tree_edges is a list of
+    the edges used, in increasing order of cost, and clusters is the
+    UnionFindStructure holding the resulting clusters.
+    
+    Each chunk costs O((n + c) + k * log(n + c)) time, where n is the
+    number of items, c the chunk size, and k the number of edges popped
+    before the forest spans all the items (or, for the last chunk, before
+    we're down to num_clusters clusters). At most n - 1 + 2 * c edges are
+    held in memory at a time: the forest, the current chunk, and the next
+    chunk, which we read ahead to know whether the current one is the last.
+    """
+    items = list(items)
+    if num_clusters < 1:
+        raise ValueError('num_clusters must be at least 1')
+    if chunk_size is not None and chunk_size >= 1:
+        chunk_size = max(chunk_size, len(items))
+    forest = []
+    chunks = _chunks(edges, chunk_size)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        next_chunk = next(chunks, None)
+        if next_chunk is None:
+            # last chunk; we can stop as soon as we have num_clusters
+            # clusters
+            max_edges = len(items) - num_clusters
+        else:
+            # later chunks might have cheaper edges; keep a whole spanning
+            # forest around
+            max_edges = len(items) - 1
+        forest = _spanning_forest(items, itertools.chain(forest, chunk),
+                                  max_edges)
+        chunk = next_chunk
+    # single-linkage clustering: join the cheapest forest edges until
+    # we're down to num_clusters clusters
+    clusters = unionfind.UnionFindStructure(items)
+    tree_edges = []
+    for edge in forest:
+        if clusters.num_clusters() <= num_clusters:
+            break
+        clusters.union(edge[1], edge[2])
+        tree_edges.append(edge)
+    return tree_edges, clusters
+
+
+def cluster_labels(items, edges, num_clusters=1, chunk_size=None):
+    """
+    Run Kruskal's algorithm on a stream of edges and label each item with
+    its cluster.
+    
+    Arguments are the same as for kruskal().
+    
+    Returns a tuple (tree_edges, labels) where tree_edges is a list of the
+    edges used, in increasing order of cost, and labels is a list with
+    the cluster number (0, 1, ...) of each item, in the order items were
+    given. Clusters are numbered in order of first appearance.
+    """
+    items = list(items)
+    tree_edges, clusters = kruskal(items, edges, num_clusters, chunk_size)
+    numbers = {}
+    labels = []
+    for item in items:
+        leader = clusters.find(item)
+        if leader not in numbers:
+            numbers[leader] = len(numbers)
+        labels.append(numbers[leader])
+    return tree_edges, labels
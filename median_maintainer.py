@@ -5,6 +5,7 @@ Operations:
 - __len__
 - insert 
 - median
+- save / load
 
 Author:  
   Christos Nitsas  
@@ -121,6 +122,31 @@ class MedianMaintainer:
             else:
                 self.lower_half.insert(item)
     
+    def save(self, file):
+        """
+        Save the structure to a binary file.
+        
+        file -- a file object open for writing in binary mode
+        
+        Both heaps are saved with BinaryHeap.save(), one after the other.
+        """
+        self.lower_half.save(file)
+        self.higher_half.save(file)
+    
+    @classmethod
+    def load(cls, file):
+        """
+        Load a structure saved with save() from a binary file.
+        
+        file -- a file object open for reading in binary mode
+        
+        Complexity is that of reading the file; no item is re-inserted.
+        """
+        median_maintainer = cls()
+        median_maintainer.lower_half = binary_heap.BinaryHeap.load(file)
+        median_maintainer.higher_half = binary_heap.BinaryHeap.load(file)
+        return median_maintainer
+    
     def median(self, if_even=EvenChoice.Lower):
         """
         Return the median of the items inserted so far.
@@ -2,6 +2,7 @@
 
 
 import unittest
+import io
 import random
 # modules I've written:
 import binary_heap
@@ -109,6 +110,82 @@ class BinaryHeapTestCase(unittest.TestCase):
         self.assertRaises(LookupError, heap.pop)
 
 
+class SaveLoadTestCase(unittest.TestCase):
+    """
+    Test BinaryHeap.save and BinaryHeap.load.
+    """
+    def round_trip(self, items, max_=False):
+        """
+        Save and load a heap of the given items; make sure the loaded heap
+        pops the same items in the same order as the original.
+        """
+        heap = binary_heap.BinaryHeap(list(items), max_=max_)
+        file_ = io.BytesIO()
+        heap.save(file_)
+        file_.seek(0)
+        loaded = binary_heap.BinaryHeap.load(file_)
+        self.assertEqual(len(loaded), len(heap))
+        while len(heap) > 0:
+            self.assertEqual(loaded.pop(), heap.pop())
+        self.assertEqual(len(loaded), 0)
+        return loaded
+    
+    def test_numeric_heaps(self):
+        """
+        Test that heaps of ints or floats round-trip as arrays of numbers.
+        """
+        ints = [random.randint(-2**63, 2**63 - 1) for _ in range(1000)]
+        self.round_trip(ints)
+        self.round_trip(ints, max_=True)
+        floats = [random.random() for _ in range(1000)]
+        self.round_trip(floats)
+        self.round_trip([])
+        heap = binary_heap.BinaryHeap(list(ints))
+        file_ = io.BytesIO()
+        heap.save(file_)
+        file_.seek(0)
+        loaded = binary_heap.BinaryHeap.load(file_)
+        # loaded numeric heaps still accept insertions, even of floats
+        loaded.insert(-2**63)
+        self.assertEqual(loaded.peek(), -2**63)
+        loaded.insert(-2.0**64)
+        self.assertEqual(loaded.peek(), -2.0**64)
+    
+    def test_object_heaps(self):
+        """
+        Test that heaps of other items (and of huge ints) round-trip.
+        """
+        items = []
+        for _ in range(1000):
+            priority = random.randint(-1000, 1000)
+            items.append((priority, str(priority)))
+        self.round_trip(items)
+        self.round_trip([2**64, -2**64, 1, 0])
+        self.round_trip([1, 2.5, 3])
+    
+    def test_not_a_saved_heap(self):
+        """
+        Test loading from a file that doesn't hold a saved heap.
+        """
+        self.assertRaises(ValueError, binary_heap.BinaryHeap.load,
+                          io.BytesIO(b'not a saved heap at all'))
+        self.assertRaises(ValueError, binary_heap.BinaryHeap.load,
+                          io.BytesIO(b''))
+    
+    def test_empty_heap_accepts_anything(self):
+        """
+        Test that a loaded empty heap accepts tuples, strings and floats.
+        """
+        for item in [(5, 'cb'), 'c', 2.5]:
+            file_ = io.BytesIO()
+            binary_heap.BinaryHeap().save(file_)
+            file_.seek(0)
+            loaded = binary_heap.BinaryHeap.load(file_)
+            self.assertEqual(len(loaded), 0)
+            loaded.insert(item)
+            self.assertEqual(loaded.pop(), item)
+
+
 def main():
     unittest.main()
 
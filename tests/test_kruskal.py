@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+
+import unittest
+import random
+# modules I've written:
+import kruskal
+
+
+class KruskalTestCase(unittest.TestCase):
+    """
+    Test kruskal.kruskal and kruskal.cluster_labels.
+    """
+    def setUp(self):
+        self.items = list(range(100))
+        self.edges = []
+        for _ in range(1000):
+            item_a = random.choice(self.items)
+            item_b = random.choice(self.items)
+            self.edges.append((random.randint(0, 10**6), item_a, item_b))
+    
+    def test_chunked_matches_single_chunk(self):
+        """
+        Test that consuming edges in chunks gives the same tree as
+        consuming them all at once.
+        """
+        tree_edges, _ = kruskal.kruskal(self.items, self.edges)
+        tree_cost = sum(edge[0] for edge in tree_edges)
+        for chunk_size in (1, 17, 250, 5000):
+            chunked_edges, _ = kruskal.kruskal(self.items, iter(self.edges),
+                                               chunk_size=chunk_size)
+            self.assertEqual(sum(edge[0] for edge in chunked_edges),
+                             tree_cost)
+            self.assertEqual(len(chunked_edges), len(tree_edges))
+    
+    def test_tree_is_sorted_and_spanning(self):
+        """
+        Test that the tree edges come in increasing order of cost and
+        connect all the items of a connected graph.
+        """
+        # make sure the graph is connected
+        for item in self.items[1:]:
+            self.edges.append((10**7, item - 1, item))
+        tree_edges, clusters = kruskal.kruskal(self.items, self.edges,
+                                               chunk_size=100)
+        self.assertEqual(len(tree_edges), len(self.items) - 1)
+        self.assertEqual(tree_edges, sorted(tree_edges))
+        self.assertEqual(clusters.num_clusters(), 1)
+    
+    def test_cluster_labels(self):
+        """
+        Test single-linkage clustering on two obvious clusters.
+        """
+        items = ['a', 'b', 'c', 'x', 'y']
+        edges = [(1, 'a', 'b'), (2, 'b', 'c'), (1, 'x', 'y'),
+                 (50, 'c', 'x'), (3, 'a', 'c')]
+        tree_edges, labels = kruskal.cluster_labels(items, edges,
+                                                    num_clusters=2,
+                                                    chunk_size=2)
+        self.assertEqual(labels, [0, 0, 0, 1, 1])
+        self.assertEqual(len(tree_edges), 3)
+        self.assertRaises(ValueError, kruskal.kruskal, items, edges, 0)
+    
+    def test_unorderable_items(self):
+        """
+        Test edges of equal cost between items that can't be compared.
+        """
+        items = [object() for _ in range(6)]
+        edges = [(1, items[i], items[j])
+                 for i in range(6) for j in range(i + 1, 6)]
+        tree_edges, labels = kruskal.cluster_labels(items, edges,
+                                                    num_clusters=2,
+                                                    chunk_size=3)
+        self.assertEqual(len(tree_edges), 4)
+        self.assertEqual(len(set(labels)), 2)
+        self.assertRaises(ValueError, kruskal.kruskal, items, edges,
+                          chunk_size=0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
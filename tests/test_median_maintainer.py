@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+
+import unittest
+import io
+import random
+# modules I've written:
+import median_maintainer
+
+
+class SaveLoadTestCase(unittest.TestCase):
+    """
+    Test MedianMaintainer.save and MedianMaintainer.load.
+    """
+    def test_round_trip(self):
+        """
+        Test that a loaded structure keeps maintaining the same median as
+        the original.
+        """
+        original = median_maintainer.MedianMaintainer()
+        for _ in range(1001):
+            original.insert(random.randint(-1000, 1000))
+        file_ = io.BytesIO()
+        original.save(file_)
+        file_.seek(0)
+        loaded = median_maintainer.MedianMaintainer.load(file_)
+        self.assertEqual(len(loaded), len(original))
+        self.assertEqual(loaded.median(), original.median())
+        for _ in range(100):
+            item = random.randint(-1000, 1000)
+            original.insert(item)
+            loaded.insert(item)
+            self.assertEqual(loaded.median(), original.median())
+    
+    def test_one_item(self):
+        """
+        Test that a loaded one-item structure (i.e. with an empty heap)
+        accepts strings, and that a loaded int one accepts floats.
+        """
+        for first, later in [('b', ['c', 'a']), (1, [2.5, 0.5])]:
+            original = median_maintainer.MedianMaintainer()
+            original.insert(first)
+            file_ = io.BytesIO()
+            original.save(file_)
+            file_.seek(0)
+            loaded = median_maintainer.MedianMaintainer.load(file_)
+            for item in later:
+                original.insert(item)
+                loaded.insert(item)
+                self.assertEqual(loaded.median(), original.median())
+        self.assertEqual(loaded.median(), 1)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
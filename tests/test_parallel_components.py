@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+
+import unittest
+import array
+import random
+from multiprocessing import shared_memory
+# modules I've written:
+import parallel_components
+import unionfind
+
+
+class ConnectedComponentsTestCase(unittest.TestCase):
+    """
+    Test parallel_components.connected_components.
+    """
+    def setUp(self):
+        self.num_items = 1000
+        self.edges = []
+        for _ in range(800):
+            self.edges.append((random.randrange(self.num_items),
+                               random.randrange(self.num_items)))
+        self.reference = unionfind.UnionFindStructure(range(self.num_items))
+        for item_a, item_b in self.edges:
+            self.reference.union(item_a, item_b)
+    
+    def check(self, num_clusters, labels):
+        """
+        Check the result of connected_components against self.reference.
+        """
+        self.assertEqual(num_clusters, self.reference.num_clusters())
+        self.assertEqual(len(labels), self.num_items)
+        for item_a in range(self.num_items):
+            item_b = random.randrange(self.num_items)
+            self.assertEqual(labels[item_a] == labels[item_b],
+                             self.reference.joined(item_a, item_b))
+    
+    def test_single_process(self):
+        """
+        Test connected_components without worker processes.
+        """
+        self.check(*parallel_components.connected_components(
+            self.num_items, self.edges, processes=1))
+    
+    def test_shards(self):
+        """
+        Test connected_components with several (not a power of 2) shards,
+        with both kinds of edge input.
+        """
+        self.check(*parallel_components.connected_components(
+            self.num_items, self.edges, processes=2, num_shards=5))
+        endpoints = array.array('q')
+        for item_a, item_b in self.edges:
+            endpoints.extend((item_a, item_b))
+        self.check(*parallel_components.connected_components(
+            self.num_items, endpoints, processes=2, num_shards=3))
+    
+    def test_bad_edge_arrays(self):
+        """
+        Test that edge arrays of the wrong type or of odd length are
+        rejected the same way with or without worker processes.
+        """
+        for processes in (1, 2):
+            self.assertRaises(ValueError,
+                              parallel_components.connected_components,
+                              4, array.array('l', [0, 1, 2, 3]), processes)
+            self.assertRaises(ValueError,
+                              parallel_components.connected_components,
+                              4, array.array('q', [0, 1, 2]), processes)
+    
+    def test_lost_hooks_are_redone(self):
+        """
+        Test that a hook overwritten by another worker's hook gets redone.
+        """
+        block = shared_memory.SharedMemory(create=True, size=6 * 8)
+        try:
+            parent = block.buf.cast('q')
+            parent[:] = array.array('q', range(6))
+            # two workers hooked leader 5 at the same time; worker a's hook
+            # (5 -> 2) was overwritten by worker b's (5 -> 1)
+            parent[5] = 1
+            hooks_a = array.array('q', [5, 2])
+            hooks_b = array.array('q', [5, 1])
+            parent.release()
+            hooks_a, num_redone = parallel_components._check_hooks(
+                (block.name, hooks_a))
+            self.assertEqual(num_redone, 1)
+            hooks_b, num_redone = parallel_components._check_hooks(
+                (block.name, hooks_b))
+            self.assertEqual(num_redone, 0)
+            self.assertEqual(parallel_components._flatten((block.name, 0, 6)),
+                             4)
+            self.assertEqual(list(block.buf.cast('q')), [0, 1, 1, 3, 4, 1])
+        finally:
+            block.close()
+            block.unlink()
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+
+import unittest
+import random
+# modules I've written:
+import timing_wheel
+
+
+class TimingWheelTestCase(unittest.TestCase):
+    """
+    Test timing_wheel.TimingWheel class.
+    """
+    def setUp(self):
+        self.empty_wheel = timing_wheel.TimingWheel()
+    
+    def test_empty_wheel(self):
+        """
+        Test the empty wheel.
+        """
+        self.assertEqual(len(self.empty_wheel), 0)
+        self.assertRaises(LookupError, self.empty_wheel.peek)
+        self.assertRaises(LookupError, self.empty_wheel.pop)
+        self.assertRaises(LookupError, self.empty_wheel.cancel, 0)
+        self.assertEqual(self.empty_wheel.expire(10**6), [])
+    
+    def test_random_insertions_cancels_and_pops(self):
+        """
+        Test the wheel on a string of random insertions, cancels and pops,
+        with deadlines both near and far.
+        """
+        wheel = timing_wheel.TimingWheel(start=-1000)
+        # handle -> item, for the timers that should be inside the wheel
+        timers = {}
+        last_deadline = -1000
+        for i in range(3000):
+            choice = random.randint(1, 10)
+            if choice <= 5:
+                distance = random.choice([random.randrange(100),
+                                          random.randrange(10**4),
+                                          random.randrange(10**8)])
+                item = (last_deadline + distance, i)
+                timers[wheel.insert(item)] = item
+            elif choice <= 7 and len(timers) > 0:
+                handle = random.choice(list(timers))
+                wheel.cancel(handle)
+                del timers[handle]
+                self.assertRaises(LookupError, wheel.cancel, handle)
+            elif len(timers) > 0:
+                peeked_item = wheel.peek()
+                popped_item = wheel.pop()
+                self.assertEqual(peeked_item, popped_item)
+                self.assertEqual(popped_item[0],
+                                 min(item[0] for item in timers.values()))
+                for handle, item in list(timers.items()):
+                    if item == popped_item:
+                        del timers[handle]
+                last_deadline = popped_item[0]
+            self.assertEqual(len(wheel), len(timers))
+    
+    def test_expire(self):
+        """
+        Test that expire returns exactly the timers that are due, in order.
+        """
+        wheel = timing_wheel.TimingWheel()
+        deadlines = [random.randrange(10**6) for _ in range(2000)]
+        for deadline in deadlines:
+            wheel.insert((deadline, str(deadline)))
+        deadlines.sort()
+        due = 0
+        for time in range(0, 10**6 + 10**5, 10**5):
+            expired = wheel.expire(time)
+            self.assertEqual([item[0] for item in expired],
+                             [d for d in deadlines[due:] if d <= time])
+            due += len(expired)
+            self.assertEqual(len(wheel), len(deadlines) - due)
+        self.assertEqual(len(wheel), 0)
+    
+    def test_resolution(self):
+        """
+        Test a wheel with float deadlines quantized to milliseconds.
+        """
+        wheel = timing_wheel.TimingWheel(resolution=0.001)
+        deadlines = [random.random() * 100 for _ in range(1000)]
+        for deadline in deadlines:
+            wheel.insert((deadline, None))
+        popped = [wheel.pop()[0] for _ in range(len(deadlines))]
+        self.assertEqual(sorted(popped), sorted(deadlines))
+        for earlier, later in zip(popped, popped[1:]):
+            self.assertTrue(earlier // 0.001 <= later // 0.001)
+    
+    def test_insert_before_peeked_timer(self):
+        """
+        Test that timers inserted after a peek with earlier deadlines come
+        out first and expire on time.
+        """
+        wheel = timing_wheel.TimingWheel()
+        wheel.insert((100, 'late'))
+        self.assertEqual(wheel.peek(), (100, 'late'))
+        wheel.insert((10, 'early'))
+        handle = wheel.insert((5, 'cancelled'))
+        wheel.cancel(handle)
+        self.assertEqual(wheel.peek(), (10, 'early'))
+        self.assertEqual(wheel.expire(9), [])
+        self.assertEqual(wheel.expire(10), [(10, 'early')])
+        self.assertEqual(wheel.expire(20), [])
+        wheel.insert((50, 'middle'))
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.pop(), (50, 'middle'))
+        self.assertEqual(wheel.pop(), (100, 'late'))
+        self.assertEqual(len(wheel), 0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+
+import unittest
+import array
+import os
+import random
+import tempfile
+# modules I've written:
+import unionfind
+
+
+class UnionFindWithRollbackTestCase(unittest.TestCase):
+    """
+    Test unionfind.UnionFindWithRollback class.
+    """
+    def setUp(self):
+        self.items = list(range(200))
+        self.structure = unionfind.UnionFindStructure(
+            self.items, impl=unionfind.UnionFindWithRollback)
+    
+    def snapshot(self):
+        return [self.structure.find(item) for item in self.items]
+    
+    def test_unions_agree_with_simple_impl(self):
+        """
+        Test that a string of random unions gives the same clusters as
+        UnionFindSimpleImpl.
+        """
+        simple = unionfind.UnionFindStructure(self.items)
+        for _ in range(150):
+            item_a = random.choice(self.items)
+            item_b = random.choice(self.items)
+            self.structure.union(item_a, item_b)
+            simple.union(item_a, item_b)
+            self.assertEqual(self.structure.num_clusters(),
+                             simple.num_clusters())
+        for item_a in self.items:
+            item_b = random.choice(self.items)
+            self.assertEqual(self.structure.joined(item_a, item_b),
+                             simple.joined(item_a, item_b))
+        self.assertEqual(sorted(sorted(c) for c in self.structure.clusters()),
+                         sorted(sorted(c) for c in simple.clusters()))
+    
+    def test_nested_rollbacks(self):
+        """
+        Test that rollback restores the state of the matching checkpoint.
+        """
+        self.assertRaises(LookupError, self.structure.rollback)
+        snapshots = []
+        for _ in range(5):
+            snapshots.append((self.snapshot(), self.structure.num_clusters()))
+            self.structure.checkpoint()
+            for _ in range(30):
+                self.structure.union(random.choice(self.items),
+                                     random.choice(self.items))
+        while len(snapshots) > 0:
+            self.structure.rollback()
+            leaders, num_clusters = snapshots.pop()
+            self.assertEqual(self.snapshot(), leaders)
+            self.assertEqual(self.structure.num_clusters(), num_clusters)
+        self.assertEqual(self.structure.num_clusters(), len(self.items))
+        self.assertRaises(LookupError, self.structure.rollback)
+
+
+class UnionFindArrayTestCase(unittest.TestCase):
+    """
+    Test unionfind.UnionFindArray class.
+    """
+    def test_unions_agree_with_simple_impl(self):
+        """
+        Test that a string of random unions gives the same clusters as
+        UnionFindSimpleImpl.
+        """
+        num_items = 300
+        structure = unionfind.UnionFindStructure(
+            num_items, impl=unionfind.UnionFindArray)
+        simple = unionfind.UnionFindStructure(range(num_items))
+        for _ in range(250):
+            item_a = random.randrange(num_items)
+            item_b = random.randrange(num_items)
+            structure.union(item_a, item_b)
+            simple.union(item_a, item_b)
+            self.assertEqual(structure.num_clusters(), simple.num_clusters())
+        labels = structure.labels()
+        for item_a in range(num_items):
+            item_b = random.randrange(num_items)
+            self.assertEqual(structure.joined(item_a, item_b),
+                             simple.joined(item_a, item_b))
+            self.assertEqual(labels[item_a] == labels[item_b],
+                             simple.joined(item_a, item_b))
+        self.assertEqual(sorted(sorted(c) for c in structure.clusters()),
+                         sorted(sorted(c) for c in simple.clusters()))
+    
+    def test_fill_leaders_in_chunks(self):
+        """
+        Test filling a caller's leader buffer a few items at a time.
+        """
+        parent = array.array('q', [-1] * 11)
+        unionfind._fill_leaders(parent, 10, chunk_size=3)
+        self.assertEqual(list(parent), list(range(10)) + [-1])
+
+
+class UnionFindMemoryMappedTestCase(unittest.TestCase):
+    """
+    Test unionfind.UnionFindMemoryMapped class.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'clusters.uf')
+        self.num_items = 500
+        self.pairs = []
+        for _ in range(400):
+            self.pairs.append((random.randrange(self.num_items),
+                               random.randrange(self.num_items)))
+        self.simple = unionfind.UnionFindStructure(range(self.num_items))
+        for item_a, item_b in self.pairs:
+            self.simple.union(item_a, item_b)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def check(self, structure):
+        """
+        Check structure's clusters against self.simple's.
+        """
+        self.assertEqual(structure.num_clusters(), self.simple.num_clusters())
+        for item_a in range(self.num_items):
+            item_b = random.randrange(self.num_items)
+            self.assertEqual(structure.joined(item_a, item_b),
+                             self.simple.joined(item_a, item_b))
+    
+    def test_reopen(self):
+        """
+        Test union_many, then closing and reopening the file.
+        """
+        half = len(self.pairs) // 2
+        with unionfind.UnionFindMemoryMapped(self.path,
+                                             self.num_items) as structure:
+            structure.union_many(self.pairs[:half], batch_size=64)
+        with unionfind.UnionFindMemoryMapped(self.path) as structure:
+            structure.union_many(self.pairs[half:])
+            self.check(structure)
+        self.assertRaises(ValueError, structure.union, 0, 1)
+    
+    def test_reopen_after_flush(self):
+        """
+        Test reopening a file that was flushed but never closed.
+        """
+        structure = unionfind.UnionFindMemoryMapped(self.path, self.num_items)
+        structure.union_many(self.pairs)
+        structure.flush()
+        with unionfind.UnionFindMemoryMapped(self.path) as reopened:
+            self.check(reopened)
+        structure.close()
+    
+    def test_not_a_union_find_file(self):
+        """
+        Test reopening a file that doesn't hold a Union-Find structure.
+        """
+        with open(self.path, 'wb') as file_:
+            file_.write(b'not a union-find structure at all')
+        self.assertRaises(ValueError, unionfind.UnionFindMemoryMapped,
+                          self.path)
+    
+    def test_truncated_file(self):
+        """
+        Test reopening a file with a valid header but missing items.
+        """
+        unionfind.UnionFindMemoryMapped(self.path, self.num_items).close()
+        with open(self.path, 'r+b') as file_:
+            file_.truncate(os.path.getsize(self.path) - 1)
+        self.assertRaises(ValueError, unionfind.UnionFindMemoryMapped,
+                          self.path)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+A hierarchical timing wheel, i.e. a priority queue for timers with integer
+(or quantized) time keys.
+
+Operations:
+- __len__
+- insert
+- cancel
+- pop
+- peek
+- expire
+
+Author:
+  Christos Nitsas
+  (nitsas)
+  (chrisnitsas)
+
+Language:
+  Python 3(.8)
+
+Date:
+  October, 2026
+"""
+
+
+# modules I've implemented
+import binary_heap
+
+
+__all__ = ['TimingWheel']
+
+
+# each level of the wheel has 2**_BITS slots
+_BITS = 6
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+
+
+def _lowest_bit(bitmap):
+    """Return the index of the lowest set bit of a positive int."""
+    return (bitmap & -bitmap).bit_length() - 1
+
+
+class TimingWheel:
+    """
+    A hierarchical timing wheel, i.e. a priority queue for timers with
+    integer (or quantized) time keys.
+    
+    Items are tuples in the form (deadline, data), as with BinaryHeap, and
+    come out in increasing order of deadline; items whose deadlines fall in
+    the same tick come out in no particular order.
+    
+    The wheel has a current time, which only moves forward when the timers
+    of a slot of a higher level are moved down to the lower levels; it then
+    becomes the start of that slot. Popping timers from the first level
+    never moves it, so it can lag well behind the last deadline popped.
+    Timers can still be inserted with deadlines before it; they're kept in
+    a BinaryHeap on the side (so they cost O(log(n)) instead of O(1)) and
+    come out in order, ahead of the rest.
+    
+    Level l of the wheel has 64 slots, each covering 64**l ticks. A timer
+    goes to the lowest level whose slots tell its deadline apart from the
+    wheel's current time, so insert() and cancel() take constant time, and
+    each timer is moved down a level at most a few times (once per 6 bits
+    of distance to its deadline) before it's popped.
+    """
+    
+    def __init__(self, start=0, resolution=1):
+        """
+        Initialize an empty timing wheel.
+        
+        start -- the wheel's initial time; timers due before it take the
+                 slower BinaryHeap path
+        resolution -- the length of a tick; deadlines are quantized to
+                      int(deadline // resolution) ticks
+        """
+        self._resolution = resolution
+        # ticks are counted from start, so they're never negative
+        self._origin = int(start // resolution)
+        # the wheel's current time, in ticks; no timer expires before it
+        self._now = 0
+        # self._levels[level][slot] is a dict {handle: (tick, item)}
+        self._levels = []
+        # bit s of self._bitmaps[level] is set iff self._levels[level][s]
+        # is not empty
+        self._bitmaps = []
+        # handle -> (level, slot) for every timer in the wheel, or
+        # handle -> None for timers due before the wheel's current time
+        self._where = {}
+        # (tick, handle, item) for the timers due before the wheel's current
+        # time; cancelled ones are only removed when they reach the top
+        self._overdue = binary_heap.BinaryHeap()
+        self._num_overdue = 0
+        self._next_handle = 0
+    
+    def __len__(self):
+        """Return the number of timers in the wheel as an int."""
+        return len(self._where)
+    
+    def _tick(self, deadline):
+        """Return the tick a deadline falls in, as an int."""
+        return int(deadline // self._resolution) - self._origin
+    
+    def _place(self, handle, tick, item):
+        """
+        Put a timer in the right slot for the wheel's current time.
+        
+        tick must not be before the wheel's current time.
+        """
+        now = self._now
+        # the level of the highest digit where tick and now differ
+        level = (((tick ^ now) >> _BITS).bit_length() + _BITS - 1) // _BITS
+        while level >= len(self._levels):
+            self._levels.append([{} for _ in range(_SLOTS)])
+            self._bitmaps.append(0)
+        slot = (tick >> (level * _BITS)) & _MASK
+        self._levels[level][slot][handle] = (tick, item)
+        self._bitmaps[level] |= 1 << slot
+        self._where[handle] = (level, slot)
+    
+    def _advance(self, limit=None):
+        """
+        Return the slot of the wheel's first level that holds the earliest
+        timers, moving timers down from higher levels as needed.
+        
+        limit -- if given, don't move the wheel's time past this tick;
+                 return None instead if the earliest timers are due later
+        
+        The wheel must not be empty.
+        """
+        while True:
+            bitmap = self._bitmaps[0] >> (self._now & _MASK)
+            if bitmap:
+                return (self._now & _MASK) + _lowest_bit(bitmap)
+            # find the earliest slot of the lowest non-empty level
+            for level in range(1, len(self._levels)):
+                if self._bitmaps[level]:
+                    break
+            shift = level * _BITS
+            slot = _lowest_bit(self._bitmaps[level])
+            high = shift + _BITS
+            now = (self._now >> high << high) | (slot << shift)
+            if limit is not None and now > limit:
+                return None
+            # move the wheel's time to the start of that slot and spread the
+            # slot's timers over the lower levels
+            self._now = now
+            entries = self._levels[level][slot]
+            self._levels[level][slot] = {}
+            self._bitmaps[level] &= ~(1 << slot)
+            for handle, (tick, item) in entries.items():
+                self._place(handle, tick, item)
+    
+    def _first_overdue(self):
+        """
+        Return the (tick, handle, item) entry of the earliest overdue timer,
+        or None if there are none.
+        """
+        if self._num_overdue == 0:
+            if len(self._overdue) > 0:
+                # only cancelled timers left
+                self._overdue = binary_heap.BinaryHeap()
+            return None
+        overdue = self._overdue
+        # drop cancelled timers from the top
+        while overdue.peek()[1] not in self._where:
+            overdue.pop()
+        return overdue.peek()
+    
+    def _pop_overdue(self):
+        """Remove and return the item of the earliest overdue timer."""
+        tick, handle, item = self._overdue.pop()
+        del self._where[handle]
+        self._num_overdue -= 1
+        return item
+    
+    def _clear_if_empty(self, level, slot):
+        """Update the bitmap of a level after removing timers from a slot."""
+        if not self._levels[level][slot]:
+            self._bitmaps[level] &= ~(1 << slot)
+    
+    def insert(self, item):
+        """
+        Insert a new timer and return a handle for cancel().
+        
+        item -- a tuple in the form (deadline, data)
+        
+        This operation's time complexity is `O(1)`, unless the deadline is
+        before the wheel's current time.
+        """
+        handle = self._next_handle
+        self._next_handle = handle + 1
+        tick = self._tick(item[0])
+        if tick < self._now:
+            self._overdue.insert((tick, handle, item))
+            self._where[handle] = None
+            self._num_overdue += 1
+        else:
+            self._place(handle, tick, item)
+        return handle
+    
+    def cancel(self, handle):
+        """
+        Remove a timer from the wheel.
+        
+        handle -- the handle insert() returned for the timer
+        
+        This operation's time complexity is `O(1)`.
+        
+        Raises a `LookupError('cancel unknown timer')` if the timer has
+        already been popped or cancelled.
+        """
+        try:
+            where = self._where.pop(handle)
+        except KeyError:
+            raise LookupError('cancel unknown timer')
+        if where is None:
+            # overdue; it'll be dropped when it reaches the top of the heap
+            self._num_overdue -= 1
+            return
+        level, slot = where
+        del self._levels[level][slot][handle]
+        self._clear_if_empty(level, slot)
+    
+    def peek(self):
+        """
+        Return the timer with the earliest deadline without removing it.
+        
+        Raises a `LookupError('peek into empty timing wheel')` if the wheel
+        is empty.
+        """
+        if len(self._where) == 0:
+            raise LookupError('peek into empty timing wheel')
+        first_overdue = self._first_overdue()
+        if first_overdue is not None:
+            return first_overdue[2]
+        entries = self._levels[0][self._advance()]
+        tick, item = entries[next(reversed(entries))]
+        return item
+    
+    def pop(self):
+        """
+        Remove and return the timer with the earliest deadline.
+        
+        This operation's amortized time complexity is `O(1)` for deadlines
+        within a fixed distance of each other.
+        
+        Raises a `LookupError('pop from empty timing wheel')` if the wheel
+        is empty.
+        """
+        if len(self._where) == 0:
+            raise LookupError('pop from empty timing wheel')
+        if self._first_overdue() is not None:
+            return self._pop_overdue()
+        slot = self._advance()
+        handle, (tick, item) = self._levels[0][slot].popitem()
+        del self._where[handle]
+        self._clear_if_empty(0, slot)
+        return item
+    
+    def expire(self, time):
+        """
+        Remove and return a list of all the timers that are due by time,
+        i.e. whose deadlines fall in the same tick as time or earlier.
+        
+        The timers come out in increasing order of deadline.
+        """
+        tick = self._tick(time)
+        expired = []
+        # overdue timers are all due before the ones in the wheel
+        while True:
+            first_overdue = self._first_overdue()
+            if first_overdue is None:
+                break
+            if first_overdue[0] > tick:
+                return expired
+            expired.append(self._pop_overdue())
+        while len(self._where) > 0:
+            slot = self._advance(limit=tick)
+            if slot is None or (self._now & ~_MASK) | slot > tick:
+                break
+            entries = self._levels[0][slot]
+            self._levels[0][slot] = {}
+            self._bitmaps[0] &= ~(1 << slot)
+            for handle, (_, item) in entries.items():
+                del self._where[handle]
+                expired.append(item)
+        return expired
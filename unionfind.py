@@ -13,6 +13,13 @@ July, 2014
 """
 
 
+import array
+import itertools
+import mmap
+import os
+import struct
+
+
 class UnionFindSimpleImpl:
     """
     A simple Union-Find data structure implementation.
@@ -173,6 +180,400 @@ class UnionFindUnionByRankAndPathCompression:
         raise(NotImplementedError)
 
 
+class UnionFindWithRollback:
+    """
+    A Union-Find implementation whose unions can be undone.
+    
+    It uses union by rank but no path compression, so that each union
+    changes a single leader pointer and can be undone in constant time.
+    Find operations take O(log(n)) time, where n is the number of items in
+    the structure.
+    
+    Call checkpoint() to remember the current state and rollback() to undo
+    all unions made since the last checkpoint. Checkpoints nest, which is
+    what the divide-and-conquer offline dynamic connectivity algorithm needs.
+    """
+    def __init__(self, items):
+        """Initialize the Union-Find structure from an iterable."""
+        self._items = set(items)
+        self._parent = dict()
+        self._rank = dict()
+        for item in self._items:
+            self._parent[item] = item
+            self._rank[item] = 0
+        self._num_clusters = len(self._items)
+        # one entry per successful union: (leader_a, leader_b, rank_grew),
+        # where leader_b was made to follow leader_a
+        self._history = []
+        # lengths of self._history at each checkpoint
+        self._checkpoints = []
+    
+    def __getitem__(self, item):
+        """
+        Return the cluster (i.e. the cluster's leader) that the given item
+        belongs to.
+        
+        Equivalent to UnionFindStructure.find().
+        """
+        parent = self._parent
+        while parent[item] != item:
+            item = parent[item]
+        return item
+    
+    
+    def find(self, item):
+        """
+        Return the cluster (i.e. the cluster's leader) that the given item
+        belongs to.
+        
+        Equivalent to UnionFindStructure.__getitem__().
+        """
+        return self[item]
+    
+    def union(self, item_a, item_b):
+        """
+        Join together the two clusters that items item_a and item_b
+        belong to.
+        """
+        leader_a = self[item_a]
+        leader_b = self[item_b]
+        if leader_a == leader_b:
+            return
+        if self._rank[leader_b] > self._rank[leader_a]:
+            leader_a, leader_b = leader_b, leader_a
+        self._parent[leader_b] = leader_a
+        rank_grew = self._rank[leader_a] == self._rank[leader_b]
+        if rank_grew:
+            self._rank[leader_a] += 1
+        self._num_clusters -= 1
+        self._history.append((leader_a, leader_b, rank_grew))
+    
+    def joined(self, item_a, item_b):
+        """
+        Return True it the items belong to the same cluster; False otherwise.
+        """
+        if self.find(item_a) == self.find(item_b):
+            return True
+        else:
+            return False
+    
+    def checkpoint(self):
+        """Remember the current state, for a later call to rollback()."""
+        self._checkpoints.append(len(self._history))
+    
+    def rollback(self):
+        """
+        Undo all unions made since the last checkpoint, and forget that
+        checkpoint.
+        
+        Each undone union takes constant time.
+        
+        Raises a `LookupError('rollback without checkpoint')` if there is no
+        checkpoint to roll back to.
+        """
+        if len(self._checkpoints) == 0:
+            raise LookupError('rollback without checkpoint')
+        target = self._checkpoints.pop()
+        while len(self._history) > target:
+            leader_a, leader_b, rank_grew = self._history.pop()
+            self._parent[leader_b] = leader_b
+            if rank_grew:
+                self._rank[leader_a] -= 1
+            self._num_clusters += 1
+    
+    def num_clusters(self):
+        """Return the current number of clusters as an int."""
+        return self._num_clusters
+    
+    def clusters(self):
+        """
+        Return all clusters as a list of lists.
+        
+        Unlike UnionFindSimpleImpl.clusters() the result is a snapshot; it
+        won't reflect later unions or rollbacks. This takes O(n * log(n))
+        time.
+        """
+        clusters = dict()
+        for item in self._items:
+            clusters.setdefault(self[item], []).append(item)
+        return list(clusters.values())
+    
+    def items(self):
+        """Return a set containing all the items in the structure."""
+        return self._items
+
+
+# items per chunk when filling or scanning big leader arrays
+_CHUNK_SIZE = 2**20
+
+
+def _fill_leaders(parent, num_items, chunk_size=_CHUNK_SIZE):
+    """
+    Make each of the items 0, ..., num_items - 1 its own leader in the
+    leader buffer parent, a chunk at a time, so that no temporary array as
+    big as parent is ever needed.
+    """
+    for start in range(0, num_items, chunk_size):
+        stop = min(start + chunk_size, num_items)
+        parent[start:stop] = array.array('q', range(start, stop))
+
+
+class UnionFindArray:
+    """
+    A compact Union-Find implementation over the integers 0, ..., n - 1,
+    with union by rank and path halving.
+    
+    Leaders are kept in a flat array of 8-byte ints and ranks in a flat
+    array of bytes, i.e. 9 bytes per item instead of the hundreds of bytes
+    per item the dict based implementations need. Any writable buffers of
+    the right type and size can be used instead of the default
+    array.array objects, e.g. memoryviews over shared memory or mmap'ed
+    files.
+    
+    A series of m union & find operations on a structure with n items
+    will need time O(m * a(n)), where a(n) is the reverse Ackerman
+    function.
+    """
+    def __init__(self, num_items, parent=None, rank=None, num_clusters=None):
+        """
+        Initialize the Union-Find structure with items 0, ..., num_items - 1,
+        each in its own cluster.
+        
+        num_items -- the number of items
+        parent -- an optional writable buffer of num_items 8-byte signed
+                  ints ('q') to keep the leaders in
+        rank -- an optional writable buffer of num_items unsigned bytes
+                ('B') to keep the ranks in
+        num_clusters -- if given, parent and rank already hold a structure
+                        with this many clusters (e.g. one built by another
+                        process) and are used as they are, not initialized
+        """
+        self._num_items = num_items
+        if num_clusters is None:
+            num_clusters = num_items
+            if parent is not None:
+                _fill_leaders(parent, num_items)
+            if rank is not None:
+                rank[:] = bytes(num_items)
+        if parent is None:
+            parent = array.array('q', range(num_items))
+        if rank is None:
+            rank = array.array('B', bytes(num_items))
+        self._parent = parent
+        self._rank = rank
+        self._num_clusters = num_clusters
+    
+    def __getitem__(self, item):
+        """
+        Return the cluster (i.e. the cluster's leader) that the given item
+        belongs to.
+        
+        Equivalent to UnionFindStructure.find().
+        """
+        parent = self._parent
+        while parent[item] != item:
+            # path halving: make item point to its grandparent
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    
+    def find(self, item):
+        """
+        Return the cluster (i.e. the cluster's leader) that the given item
+        belongs to.
+        
+        Equivalent to UnionFindStructure.__getitem__().
+        """
+        return self[item]
+    
+    def union(self, item_a, item_b):
+        """
+        Join together the two clusters that items item_a and item_b
+        belong to.
+        """
+        leader_a = self[item_a]
+        leader_b = self[item_b]
+        if leader_a == leader_b:
+            return
+        rank = self._rank
+        if rank[leader_b] > rank[leader_a]:
+            leader_a, leader_b = leader_b, leader_a
+        self._parent[leader_b] = leader_a
+        if rank[leader_a] == rank[leader_b]:
+            rank[leader_a] += 1
+        self._num_clusters -= 1
+    
+    def joined(self, item_a, item_b):
+        """
+        Return True it the items belong to the same cluster; False otherwise.
+        """
+        if self.find(item_a) == self.find(item_b):
+            return True
+        else:
+            return False
+    
+    def num_clusters(self):
+        """Return the current number of clusters as an int."""
+        return self._num_clusters
+    
+    def clusters(self):
+        """
+        Return all clusters as a list of lists.
+        
+        The result is a snapshot; it won't reflect later unions.
+        """
+        clusters = dict()
+        for item in range(self._num_items):
+            clusters.setdefault(self[item], []).append(item)
+        return list(clusters.values())
+    
+    def items(self):
+        """Return a range containing all the items in the structure."""
+        return range(self._num_items)
+    
+    def labels(self):
+        """
+        Return an array.array('q') with the leader of every item, in item
+        order.
+        """
+        return array.array('q',
+                           (self[item] for item in range(self._num_items)))
+
+
+class UnionFindMemoryMapped(UnionFindArray):
+    """
+    A UnionFindArray whose leader and rank arrays live in a memory-mapped
+    file, for structures too big to fit in RAM.
+    
+    The file holds a 32-byte header followed by the leader array (8 bytes
+    per item) and the rank array (1 byte per item), in the machine's native
+    byte order. Work can be resumed by reopening an existing file.
+    
+    Use union_many() rather than union() for big batches of unions; it
+    orders them to cut down on random page faults.
+    """
+    # magic, num_items, num_clusters, closed_cleanly
+    _header = struct.Struct('=4s4xqq?7x')
+    _magic = b'UFMM'
+    # items per chunk when scanning the leader array
+    _chunk_size = _CHUNK_SIZE
+    
+    def __init__(self, path, num_items=None):
+        """
+        Open a memory-mapped Union-Find structure.
+        
+        path -- the file to keep the structure in
+        num_items -- create a new structure with items 0, ..., num_items - 1,
+                     each in its own cluster (overwriting any existing file
+                     at path); if None (the default) reopen the existing
+                     structure at path
+        
+        Raises a `ValueError` if the existing file at path doesn't hold a
+        Union-Find structure.
+        """
+        if num_items is None:
+            self._file = open(path, 'r+b')
+            header = self._file.read(self._header.size)
+            if len(header) != self._header.size:
+                self._file.close()
+                raise ValueError('not a union-find file: ' + str(path))
+            magic, num_items, num_clusters, closed_cleanly = \
+                self._header.unpack(header)
+            size = os.fstat(self._file.fileno()).st_size
+            if magic != self._magic or num_items < 0 or \
+                    size < self._header.size + 9 * num_items:
+                self._file.close()
+                raise ValueError('not a union-find file: ' + str(path))
+        else:
+            self._file = open(path, 'w+b')
+            # the file is zero-filled, i.e. all ranks start at 0
+            self._file.truncate(self._header.size + 9 * num_items)
+            num_clusters = None
+            closed_cleanly = True
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        whole = memoryview(self._mmap)
+        start = self._header.size
+        parent = whole[start:start + 8 * num_items].cast('q')
+        rank = whole[start + 8 * num_items:start + 9 * num_items]
+        self._views = [parent, rank, whole]
+        if num_clusters is None:
+            _fill_leaders(parent, num_items, self._chunk_size)
+            num_clusters = num_items
+        super().__init__(num_items, parent, rank, num_clusters)
+        if not closed_cleanly:
+            # the number of clusters in the header might be stale
+            self._num_clusters = self._count_leaders()
+        self._write_header(closed_cleanly=False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _count_leaders(self):
+        """Count the items that are their own leaders, in one pass."""
+        parent = self._parent
+        count = 0
+        for start in range(0, self._num_items, self._chunk_size):
+            stop = min(start + self._chunk_size, self._num_items)
+            for item, leader in enumerate(parent[start:stop], start):
+                if item == leader:
+                    count += 1
+        return count
+    
+    def _write_header(self, closed_cleanly):
+        """Write the header to the start of the file."""
+        self._mmap[:self._header.size] = self._header.pack(
+            self._magic, self._num_items, self._num_clusters, closed_cleanly)
+    
+    def union_many(self, pairs, batch_size=2**20):
+        """
+        Join together the clusters of each (item_a, item_b) pair.
+        
+        pairs -- an iterable of (item_a, item_b) pairs
+        batch_size -- the number of pairs to sort at a time
+        
+        Pairs are read in batches, and each batch is sorted so that its
+        unions walk the leader array in increasing order of item, instead
+        of jumping around the file.
+        """
+        union = self.union
+        pairs = iter(pairs)
+        while True:
+            batch = [(item_a, item_b) if item_a <= item_b
+                     else (item_b, item_a)
+                     for item_a, item_b in itertools.islice(pairs,
+                                                            batch_size)]
+            if len(batch) == 0:
+                return
+            batch.sort()
+            for item_a, item_b in batch:
+                union(item_a, item_b)
+    
+    def flush(self):
+        """Write all changes so far to the file."""
+        self._write_header(closed_cleanly=False)
+        self._mmap.flush()
+    
+    def close(self):
+        """
+        Write all changes to the file and close it.
+        
+        The structure can't be used after it's closed; trying to will raise
+        a `ValueError`.
+        """
+        if self._mmap.closed:
+            return
+        self._write_header(closed_cleanly=True)
+        for view in self._views:
+            view.release()
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.close()
+
+
 _default_impl = UnionFindSimpleImpl
 
 
@@ -181,7 +582,9 @@ class UnionFindStructure:
     A Union-Find data structure interface.
     
     It relies on a concrete Union-Find implementation such as 
-    UnionFindSimpleImpl or UnionFindLazyUnionsAndPathCompressionImpl.
+    UnionFindSimpleImpl, UnionFindLazyUnionsAndPathCompressionImpl,
+    UnionFindWithRollback or UnionFindArray (which takes the number of
+    items instead of an iterable).
     """
     def __init__(self, items, *, impl=_default_impl):
         self._impl = impl(items)